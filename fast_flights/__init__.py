@@ -4,6 +4,7 @@ from .core import (
     get_flights_from_filter,
     get_top_sorted_flights,
     get_best_flights_across_dates,
+    get_best_flights_across_dates_async,
 )
 from .filter import create_filter, TFSData
 from .flights_impl import Airport, FlightData, Passengers
@@ -24,4 +25,5 @@ __all__ = [
     "get_flights",
     "get_top_sorted_flights",
     "get_best_flights_across_dates",
+    "get_best_flights_across_dates_async",
 ]
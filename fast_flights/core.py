@@ -1,6 +1,12 @@
+import asyncio
+import heapq
+import re
+import threading
+from copy import copy
+from functools import lru_cache, partial
 from typing import List, Literal, Optional
-from itertools import groupby
-from operator import attrgetter
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 
 from selectolax.lexbor import LexborHTMLParser, LexborNode
@@ -8,27 +14,35 @@ from selectolax.lexbor import LexborHTMLParser, LexborNode
 from .schema import Flight, Result
 from .flights_impl import FlightData, Passengers
 from .filter import TFSData
-from .fallback_playwright import fallback_playwright_fetch
 from .primp import Client, Response
 
 
+# One client per thread so keep-alive connections are reused across calls
+# without sharing a client between concurrent fetches.
+_local = threading.local()
+
+
+def _get_client() -> Client:
+    client = getattr(_local, "client", None)
+    if client is None:
+        client = _local.client = Client(impersonate="chrome_126", verify=False)
+    return client
+
+
 def fetch(params: dict) -> Response:
-    client = Client(impersonate="chrome_126", verify=False)
-    res = client.get("https://www.google.com/travel/flights", params=params)
+    res = _get_client().get("https://www.google.com/travel/flights", params=params)
     assert res.status_code == 200, f"{res.status_code} Result: {res.text_markdown}"
     return res
 
 
-def get_flights_from_filter(
-    filter: TFSData,
-    currency: str = "",
-    *,
-    mode: Literal["common", "fallback", "force-fallback", "local"] = "common",
+@lru_cache(maxsize=256)
+def _fetch_and_parse(
+    tfs: str,
+    currency: str,
+    mode: Literal["common", "fallback", "force-fallback", "local"],
 ) -> Result:
-    data = filter.as_b64()
-
     params = {
-        "tfs": data.decode("utf-8"),
+        "tfs": tfs,
         "hl": "en",
         "tfu": "EgQIABABIgA",
         "curr": currency,
@@ -39,6 +53,8 @@ def get_flights_from_filter(
             res = fetch(params)
         except AssertionError as e:
             if mode == "fallback":
+                from .fallback_playwright import fallback_playwright_fetch
+
                 res = fallback_playwright_fetch(params)
             else:
                 raise e
@@ -49,16 +65,35 @@ def get_flights_from_filter(
         res = local_playwright_fetch(params)
 
     else:
+        from .fallback_playwright import fallback_playwright_fetch
+
         res = fallback_playwright_fetch(params)
 
     try:
         return parse_response(res)
     except RuntimeError as e:
         if mode == "fallback":
-            return get_flights_from_filter(filter, mode="force-fallback")
+            return _fetch_and_parse(tfs, "", "force-fallback")
         raise e
 
 
+def get_flights_from_filter(
+    filter: TFSData,
+    currency: str = "",
+    *,
+    mode: Literal["common", "fallback", "force-fallback", "local"] = "common",
+) -> Result:
+    # Repeat calls with the same filter skip the request and parse entirely.
+    # The cache hands back a shared Result, so copy it and its flights before
+    # returning: callers mutate flights (e.g. the cross-dates path sets
+    # flight.date) and must not poison the cached entry for everyone else.
+    result = _fetch_and_parse(filter.as_b64().decode("utf-8"), currency, mode)
+    return Result(
+        current_price=result.current_price,
+        flights=[copy(flight) for flight in result.flights],
+    )
+
+
 def get_flights(
     *,
     flight_data: List[FlightData],
@@ -80,6 +115,120 @@ def get_flights(
     )
 
 
+# Selector strings are hoisted to module level so they are not rebuilt on
+# every parse.
+_FLIGHT_SECTIONS_SELECTOR = 'div[jsname="IWWDBc"], div[jsname="YdtKid"]'
+_FLIGHT_ITEMS_SELECTOR = "ul.Rk10dc li"
+_PRICE_LEVEL_SELECTOR = "span.gOatQ"
+_NAME_INNER_SELECTOR = "span"
+_CHILD_DIV_SELECTOR = "div"
+_STOPS_INNER_SELECTOR = ".ogfYpf"
+
+# Class sets anchoring each field inside a flight <li>, matched as subsets so
+# extra classes on a node do not break the lookup. One traversal of the row
+# collects all anchors instead of running one CSS query per field.
+_FIELD_CLASSES = (
+    ("name", frozenset(("sSHqwe", "tPgKwe", "ogfYpf"))),
+    ("dp_ar", frozenset(("mv1WYe",))),
+    ("time_ahead", frozenset(("bOzv6",))),
+    ("duration", frozenset(("Ak5kof",))),
+    ("stops", frozenset(("BbR8Ec",))),
+    ("delay", frozenset(("GsCCve",))),
+    ("price", frozenset(("FpEdX",))),
+)
+
+
+# Matches anything split/join would actually change: runs of whitespace,
+# whitespace other than a plain space, or a leading/trailing space
+_WS_DIRTY_RE = re.compile(r"\s{2,}|[^\S ]|^ | $")
+
+
+def _normalize_ws(text: str) -> str:
+    """Collapse whitespace, skipping the rebuild when nothing would change."""
+    if not text or not _WS_DIRTY_RE.search(text):
+        return text
+    return " ".join(text.split())
+
+
+# Stop counts come from a tiny fixed vocabulary; a dict hit avoids the
+# split/int/except dance for every row
+_STOPS_TABLE = {"Nonstop": 0, "1 stop": 1}
+_STOPS_TABLE.update({f"{n} stops": n for n in range(2, 10)})
+
+
+def _parse_stops(stops: str):
+    fmt = _STOPS_TABLE.get(stops)
+    if fmt is not None:
+        return fmt
+    try:
+        return int(stops.split(" ", 1)[0])
+    except ValueError:
+        return "Unknown"
+
+
+# Raw-text markers locating the results region; everything before them
+# (scripts, header chrome) never needs to enter the DOM. The price-level
+# marker is the bare class name so it matches wherever gOatQ sits in the
+# class attribute; a stray early hit only means trimming a little less.
+_RESULT_MARKERS = ("gOatQ", 'jsname="IWWDBc"', 'jsname="YdtKid"')
+
+# Fast path for the price-level span: one regex scan over the raw text
+# instead of a whole-document CSS query. Only trusted for plain text content
+# (no child tags, no entities); anything else falls back to the DOM lookup.
+_PRICE_LEVEL_RE = re.compile(r'<span class="gOatQ[^"]*"[^>]*>([^<&]+)</span>')
+
+
+def _trim_to_results(html: str) -> str:
+    """Drop everything before the results region prior to DOM construction.
+
+    Lexbor parses a fragment just fine, so start at whichever of the
+    price-level span and the flight sections appears first; if no marker is
+    present, parse the full document unchanged.
+    """
+    first = len(html)
+    for marker in _RESULT_MARKERS:
+        idx = html.find(marker)
+        if idx != -1 and idx < first:
+            first = idx
+    if first == len(html):
+        return html
+    start = html.rfind("<", 0, first)
+    return html[start:] if start != -1 else html
+
+
+def _css_first_descendant(node: LexborNode, selector: str) -> Optional[LexborNode]:
+    """css_first restricted to strict descendants.
+
+    node.css_first() can match the node itself, which turns a child lookup on
+    an anchor into a no-op; querying each child subtree keeps the original
+    descendant-only semantics.
+    """
+    for child in node.iter(include_text=False):
+        found = child.css_first(selector)
+        if found is not None:
+            return found
+    return None
+
+
+def _collect_field_nodes(item: LexborNode) -> dict:
+    """Walk a flight row once, recording the first node per field anchor."""
+    field_classes = _FIELD_CLASSES
+    nodes = {}
+    remaining = len(field_classes)
+    for node in item.traverse(include_text=False):
+        class_attr = node.attributes.get("class")
+        if not class_attr:
+            continue
+        classes = frozenset(class_attr.split())
+        for field, required in field_classes:
+            if field not in nodes and required <= classes:
+                nodes[field] = node
+                remaining -= 1
+        if not remaining:
+            break
+    return nodes
+
+
 def parse_response(
     r: Response, *, dangerously_allow_looping_last_item: bool = False
 ) -> Result:
@@ -95,22 +244,42 @@ def parse_response(
     def safe(n: Optional[LexborNode]):
         return n or blank
 
-    parser = LexborHTMLParser(r.text)
+    text = r.text
+
+    # _trim_to_results already returns the input unchanged when no marker is
+    # found, so marker-less pages get a full parse and the empty-flights
+    # check below decides whether to raise.
+    parser = LexborHTMLParser(_trim_to_results(text))
     flights = []
 
-    for i, fl in enumerate(parser.css('div[jsname="IWWDBc"], div[jsname="YdtKid"]')):
+    # Bind hot names to locals; global and method lookups add up across
+    # hundreds of rows
+    flights_append = flights.append
+    collect_field_nodes = _collect_field_nodes
+    normalize_ws = _normalize_ws
+    parse_stops = _parse_stops
+
+    for i, fl in enumerate(parser.css(_FLIGHT_SECTIONS_SELECTOR)):
         is_best_flight = i == 0
 
-        for item in fl.css("ul.Rk10dc li")[
-            : (None if dangerously_allow_looping_last_item or i == 0 else -1)
-        ]:
+        items = fl.css(_FLIGHT_ITEMS_SELECTOR)
+        if not (dangerously_allow_looping_last_item or i == 0):
+            # drop the trailing "view more" item in place instead of slicing
+            # the node list into a second copy
+            del items[-1:]
+
+        for item in items:
+            nodes = collect_field_nodes(item)
+
             # Flight name
-            name = safe(item.css_first("div.sSHqwe.tPgKwe.ogfYpf span")).text(
+            name_node = nodes.get("name")
+            name = safe(name_node and name_node.css_first(_NAME_INNER_SELECTOR)).text(
                 strip=True
             )
 
             # Get departure & arrival time
-            dp_ar_node = item.css("span.mv1WYe div")
+            dp_ar_anchor = nodes.get("dp_ar")
+            dp_ar_node = dp_ar_anchor.css(_CHILD_DIV_SELECTOR) if dp_ar_anchor else []
             try:
                 departure_time = dp_ar_node[0].text(strip=True)
                 arrival_time = dp_ar_node[1].text(strip=True)
@@ -120,32 +289,37 @@ def parse_response(
                 arrival_time = ""
 
             # Get arrival time ahead
-            time_ahead = safe(item.css_first("span.bOzv6")).text()
+            time_ahead = safe(nodes.get("time_ahead")).text()
 
             # Get duration
-            duration = safe(item.css_first("li div.Ak5kof div")).text()
+            duration_node = nodes.get("duration")
+            duration = safe(
+                duration_node
+                and _css_first_descendant(duration_node, _CHILD_DIV_SELECTOR)
+            ).text()
 
             # Get flight stops
-            stops = safe(item.css_first(".BbR8Ec .ogfYpf")).text()
+            stops_node = nodes.get("stops")
+            stops = safe(
+                stops_node
+                and _css_first_descendant(stops_node, _STOPS_INNER_SELECTOR)
+            ).text()
 
             # Get delay
-            delay = safe(item.css_first(".GsCCve")).text() or None
+            delay = safe(nodes.get("delay")).text() or None
 
             # Get prices
-            price = safe(item.css_first(".YMlIz.FpEdX")).text() or "0"
+            price = safe(nodes.get("price")).text() or "0"
 
             # Stops formatting
-            try:
-                stops_fmt = 0 if stops == "Nonstop" else int(stops.split(" ", 1)[0])
-            except ValueError:
-                stops_fmt = "Unknown"
+            stops_fmt = parse_stops(stops)
 
-            flights.append(
+            flights_append(
                 {
                     "is_best": is_best_flight,
                     "name": name,
-                    "departure": " ".join(departure_time.split()),
-                    "arrival": " ".join(arrival_time.split()),
+                    "departure": normalize_ws(departure_time),
+                    "arrival": normalize_ws(arrival_time),
                     "arrival_time_ahead": time_ahead,
                     "duration": duration,
                     "stops": stops_fmt,
@@ -154,35 +328,54 @@ def parse_response(
                 }
             )
 
-    current_price = safe(parser.css_first("span.gOatQ")).text()
+    price_level_match = _PRICE_LEVEL_RE.search(text)
+    if price_level_match:
+        current_price = price_level_match.group(1)
+    else:
+        current_price = safe(parser.css_first(_PRICE_LEVEL_SELECTOR)).text()
     if not flights:
         raise RuntimeError("No flights found:\n{}".format(r.text_markdown))
 
     return Result(current_price=current_price, flights=[Flight(**fl) for fl in flights])
 
 
+# Compiled once; the sort keys run these per flight. The duration text is
+# read without strip=True, so tolerate padding around the value.
+_DURATION_RE = re.compile(r"\s*(?:(\d+)\s*hr)?\s*(?:(\d+)\s*min)?\s*")
+_NON_NUMERIC_RE = re.compile(r"[^0-9.]")
+
+
+@lru_cache(maxsize=1024)
 def _parse_duration(duration: str) -> int:
     """Convert duration string to minutes for sorting"""
-    try:
-        hours, minutes = duration.replace(" hr ", ":").replace(" min", "").split(":")
-        return int(hours) * 60 + int(minutes)
-    except (ValueError, AttributeError):
+    match = _DURATION_RE.fullmatch(duration) if duration else None
+    if not match or match.lastindex is None:
         return float('inf')  # Return infinity for invalid durations
+    hours, minutes = match.groups()
+    return int(hours or 0) * 60 + int(minutes or 0)
+
+
+@lru_cache(maxsize=1024)
+def _parse_price(price: str) -> float:
+    """Strip currency symbols and separators, returning the numeric price"""
+    cleaned = _NON_NUMERIC_RE.sub("", price)
+    return float(cleaned) if cleaned else 0.0
 
 
 def _get_sort_key(sort_method: Literal["best", "price", "duration"]):
     """Returns the appropriate sort key function based on sort method"""
     if sort_method == "best":
-        return lambda f: (not f.is_best, float(f.price.replace("$", "").replace(",", "")), _parse_duration(f.duration))
+        return lambda f: (not f.is_best, _parse_price(f.price), _parse_duration(f.duration))
     elif sort_method == "price":
-        return lambda f: float(f.price.replace("$", "").replace(",", ""))
+        return lambda f: _parse_price(f.price)
     else:  # duration
         return lambda f: _parse_duration(f.duration)
 
 
 def _sort_and_limit_flights(flights: List[Flight], sort_method: str, limit: int = 5) -> List[Flight]:
     """Sort flights by given method and return top N results"""
-    return sorted(flights, key=_get_sort_key(sort_method))[:limit]
+    # nsmallest is O(n log k) for k results vs. O(n log n) for a full sort
+    return heapq.nsmallest(limit, flights, key=_get_sort_key(sort_method))
 
 
 def get_top_sorted_flights(
@@ -205,16 +398,16 @@ def get_top_sorted_flights(
         max_stops=max_stops,
     )
     
-    # Group flights by number of stops
-    flights_by_stops = {}
-    for stops, flights in groupby(sorted(result.flights, key=attrgetter("stops")), key=attrgetter("stops")):
-        # Sort flights within each stop group and take top 5
-        flights_by_stops[stops] = _sort_and_limit_flights(list(flights), sort_method)
-    
-    # Combine all top flights
+    # Group flights by number of stops in one pass; no need to pre-sort the
+    # whole list just so groupby sees adjacent keys
+    flights_by_stops = defaultdict(list)
+    for flight in result.flights:
+        flights_by_stops[flight.stops].append(flight)
+
+    # Combine the top 5 flights of each stop group
     top_flights = []
     for stops in sorted(flights_by_stops.keys()):
-        top_flights.extend(flights_by_stops[stops])
+        top_flights.extend(_sort_and_limit_flights(flights_by_stops[stops], sort_method))
     
     return Result(current_price=result.current_price, flights=top_flights)
 
@@ -240,23 +433,22 @@ def get_best_flights_across_dates(
     if date_diff > 5:
         raise ValueError("Maximum date range is 5 days")
     
-    # Collect flights for each date
-    all_flights = []
-    price_levels = []  # Track all price levels
-    
-    current_date = start_date
-    while current_date <= end_date:
-        flight_data = [
-            FlightData(
-                date=current_date.strftime("%Y-%m-%d"),
-                from_airport=from_airport,
-                to_airport=to_airport,
-            )
-        ]
-        
-        # Get top flights for this date
-        result = get_top_sorted_flights(
-            flight_data=flight_data,
+    # Build the per-date requests up front; date_diff is already known, so no
+    # need for a loop-carried datetime comparison against end_date
+    date_strs = [
+        (start_date + timedelta(days=offset)).strftime("%Y-%m-%d")
+        for offset in range(date_diff + 1)
+    ]
+
+    def _fetch_for_date(date_str: str) -> Result:
+        return get_top_sorted_flights(
+            flight_data=[
+                FlightData(
+                    date=date_str,
+                    from_airport=from_airport,
+                    to_airport=to_airport,
+                )
+            ],
             trip=trip,
             passengers=passengers,
             seat=seat,
@@ -264,16 +456,28 @@ def get_best_flights_across_dates(
             max_stops=max_stops,
             sort_method=sort_method,
         )
-        
-        # Track price levels
-        price_levels.append(result.current_price)
-            
-        # Add date information to flights
-        for flight in result.flights:
-            flight.date = current_date.strftime("%Y-%m-%d")
-        
-        all_flights.extend(result.flights)
-        current_date += timedelta(days=1)
+
+    # Each date is an independent HTTP round trip, so fetch them concurrently
+    all_flights = []
+    price_levels = []  # Track all price levels
+
+    with ThreadPoolExecutor(max_workers=6) as executor:
+        futures = {
+            executor.submit(_fetch_for_date, date_str): date_str
+            for date_str in date_strs
+        }
+        for future in as_completed(futures):
+            date_str = futures[future]
+            result = future.result()
+
+            # Track price levels
+            price_levels.append(result.current_price)
+
+            # Add date information to flights
+            for flight in result.flights:
+                flight.date = date_str
+
+            all_flights.extend(result.flights)
     
     # Sort all flights and take top 5 overall
     best_flights = _sort_and_limit_flights(all_flights, sort_method)
@@ -287,3 +491,41 @@ def get_best_flights_across_dates(
         overall_price = "high"
     
     return Result(current_price=overall_price, flights=best_flights)
+
+
+async def get_best_flights_across_dates_async(
+    *,
+    start_date: datetime,
+    end_date: datetime,
+    from_airport: str,
+    to_airport: str,
+    trip: Literal["round-trip", "one-way", "multi-city"],
+    passengers: Passengers,
+    seat: Literal["economy", "premium-economy", "business", "first"],
+    fetch_mode: Literal["common", "fallback", "force-fallback", "local"] = "common",
+    max_stops: Optional[int] = None,
+    sort_method: Literal["best", "price", "duration"] = "best",
+) -> Result:
+    """Awaitable variant of :func:`get_best_flights_across_dates`.
+
+    primp only offers a blocking client, so the per-date requests keep
+    running on the thread pool; this wrapper just moves the whole search off
+    the event loop so async callers are not blocked while it runs.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        None,
+        partial(
+            get_best_flights_across_dates,
+            start_date=start_date,
+            end_date=end_date,
+            from_airport=from_airport,
+            to_airport=to_airport,
+            trip=trip,
+            passengers=passengers,
+            seat=seat,
+            fetch_mode=fetch_mode,
+            max_stops=max_stops,
+            sort_method=sort_method,
+        ),
+    )
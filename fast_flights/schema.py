@@ -10,8 +10,25 @@ class Result:
     flights: List[Flight]
 
 
-@dataclass
 class Flight:
+    """A single parsed flight row.
+
+    Slotted rather than a dataclass: one result page yields dozens of these,
+    and __slots__ keeps them compact with faster attribute access.
+    """
+
+    __slots__ = (
+        "is_best",
+        "name",
+        "departure",
+        "arrival",
+        "arrival_time_ahead",
+        "duration",
+        "stops",
+        "delay",
+        "price",
+        "date",
+    )
     is_best: bool
     name: str
     departure: str
@@ -21,4 +38,40 @@ class Flight:
     stops: int
     delay: Optional[str]
     price: str
-    date: Optional[str] = None
+    date: Optional[str]
+
+    def __init__(
+        self,
+        *,
+        is_best: bool,
+        name: str,
+        departure: str,
+        arrival: str,
+        arrival_time_ahead: str,
+        duration: str,
+        stops: int,
+        delay: Optional[str],
+        price: str,
+        date: Optional[str] = None,
+    ):
+        self.is_best = is_best
+        self.name = name
+        self.departure = departure
+        self.arrival = arrival
+        self.arrival_time_ahead = arrival_time_ahead
+        self.duration = duration
+        self.stops = stops
+        self.delay = delay
+        self.price = price
+        self.date = date
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Flight):
+            return NotImplemented
+        return all(
+            getattr(self, slot) == getattr(other, slot) for slot in self.__slots__
+        )
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{slot}={getattr(self, slot)!r}" for slot in self.__slots__)
+        return f"Flight({fields})"